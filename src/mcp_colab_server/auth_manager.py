@@ -205,14 +205,33 @@ class AuthManager:
         return True
 
     def _save_credentials(self) -> None:
-        """Save credentials to token file."""
+        """Save credentials to token file atomically."""
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(self.token_file), exist_ok=True)
-            
-            with open(self.token_file, 'w') as token:
-                token.write(self.credentials.to_json())
-            
+            token_dir = os.path.dirname(self.token_file)
+            os.makedirs(token_dir, exist_ok=True)
+
+            # Write to a temp file and os.replace so a killed process
+            # can't leave a truncated (unparseable) token file behind
+            import tempfile
+            fd, tmp_path = tempfile.mkstemp(
+                dir=token_dir,
+                prefix=os.path.basename(self.token_file) + '.',
+                suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w') as token:
+                    token.write(self.credentials.to_json())
+                    token.flush()
+                    os.fsync(token.fileno())
+                os.replace(tmp_path, self.token_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+
             self.logger.info(f"Credentials saved to {self.token_file}")
             
         except Exception as e:
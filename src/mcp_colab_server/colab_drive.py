@@ -1,6 +1,5 @@
 """Google Drive API integration for Colab notebook management."""
 
-import json
 import logging
 from typing import Dict, List, Optional, Any
 from io import BytesIO
@@ -14,7 +13,10 @@ from .utils import (
     create_code_cell, 
     sanitize_filename,
     validate_notebook_id,
-    retry_with_backoff
+    retry_with_backoff,
+    json_dumps,
+    json_loads,
+    JSONDecodeError
 )
 
 
@@ -66,7 +68,7 @@ class ColabDriveManager:
                 ])
             
             # Convert content to JSON
-            notebook_json = json.dumps(content, indent=2)
+            notebook_json = json_dumps(content)
             
             # Create file metadata
             file_metadata = {
@@ -130,7 +132,7 @@ class ColabDriveManager:
             
             # Parse JSON content
             file_io.seek(0)
-            content = json.loads(file_io.read().decode('utf-8'))
+            content = json_loads(file_io.read())
             
             self.logger.info(f"Retrieved notebook content for ID: {notebook_id}")
             return content
@@ -141,7 +143,7 @@ class ColabDriveManager:
             else:
                 self.logger.error(f"HTTP error getting notebook content: {e}")
                 raise Exception(f"Failed to get notebook content: {e}")
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
             self.logger.error(f"Invalid JSON in notebook: {e}")
             raise Exception("Notebook contains invalid JSON")
         except Exception as e:
@@ -160,7 +162,7 @@ class ColabDriveManager:
                 raise ValueError("Invalid notebook ID format")
             
             # Convert content to JSON
-            notebook_json = json.dumps(content, indent=2)
+            notebook_json = json_dumps(content)
             
             # Update file
             media = MediaIoBaseUpload(
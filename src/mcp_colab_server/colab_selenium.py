@@ -199,6 +199,9 @@ class ColabSeleniumManager:
         self.timeout = self.selenium_config.get("timeout", 30)
         self.implicit_wait = self.selenium_config.get("implicit_wait", 10)
         self.page_load_timeout = self.selenium_config.get("page_load_timeout", 30)
+        # "eager" makes driver.get return at DOMContentLoaded instead of
+        # waiting for every third-party script/frame to finish loading
+        self.page_load_strategy = self.selenium_config.get("page_load_strategy", "normal")
         self.execution_timeout = self.colab_config.get("execution_timeout", 300)
         
         # Profile configuration
@@ -212,6 +215,11 @@ class ColabSeleniumManager:
         # WebDriver instance
         self.driver: Optional[webdriver.Remote] = None
         self.current_notebook_id: Optional[str] = None
+
+        # Health-check cache: a probe that passed less than this many
+        # seconds ago is trusted without another browser round trip
+        self.health_cache_ttl = self.selenium_config.get("health_cache_ttl", 2.0)
+        self._last_health_ok_at = 0.0
     
     def _create_driver(self) -> webdriver.Remote:
         """Create and configure WebDriver instance with anti-detection measures."""
@@ -254,7 +262,8 @@ class ColabSeleniumManager:
         self.logger.info("Using undetected-chromedriver for better stealth")
         
         options = uc.ChromeOptions()
-        
+        options.page_load_strategy = self.page_load_strategy
+
         # Use profile manager for consistent profile handling
         if self.use_persistent_profile:
             profile_path = self.profile_manager.get_profile_path(self.profile_name)
@@ -301,12 +310,16 @@ class ColabSeleniumManager:
             for option in additional_options:
                 options.add_argument(option)
         
+        options.page_load_strategy = self.page_load_strategy
+
         # Find Chrome binary
         self._set_chrome_binary_location(options)
         
         # Create Chrome service
         service = ChromeService(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=options)
+        # keep_alive reuses one socket to chromedriver across commands
+        # instead of a fresh TCP connection per call
+        driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
         
         # Apply stealth if available
         if STEALTH_AVAILABLE and self.selenium_config.get("use_stealth", False):
@@ -359,7 +372,7 @@ class ColabSeleniumManager:
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:120.0) Gecko/20100101 Firefox/120.0")
         
         service = FirefoxService(GeckoDriverManager().install())
-        driver = webdriver.Firefox(service=service, options=options)
+        driver = webdriver.Firefox(service=service, options=options, keep_alive=True)
         
         # Configure timeouts
         driver.implicitly_wait(self.implicit_wait)
@@ -393,6 +406,7 @@ class ColabSeleniumManager:
                 self.logger.warning(f"Error closing WebDriver: {e}")
             finally:
                 self.driver = None
+                self._last_health_ok_at = 0.0
     
     def get_profile_info(self) -> Dict[str, Any]:
         """Get information about the current Chrome profile configuration."""
@@ -477,6 +491,14 @@ class ColabSeleniumManager:
     def open_notebook(self, notebook_id: str) -> bool:
         """Open a Colab notebook in the browser."""
         try:
+            # Reuse the live browser session when this notebook is already
+            # open and healthy - skips a full page load and interface wait
+            if (notebook_id == self.current_notebook_id
+                    and self.driver is not None
+                    and self.check_session_health()):
+                self.logger.debug(f"Reusing open browser session for notebook: {notebook_id}")
+                return True
+
             self._ensure_driver()
             
             # Construct Colab URL
@@ -1085,6 +1107,32 @@ class ColabSeleniumManager:
             cell.dispatchEvent(executeEvent);
         """, cell)
     
+    # Single JavaScript round trip replacing one find_elements call per
+    # indicator selector when polling execution status
+    _INDICATORS_VISIBLE_JS = (
+        "var nodes = document.querySelectorAll(arguments[0]);"
+        "for (var i = 0; i < nodes.length; i++) {"
+        "  if (nodes[i].offsetParent !== null || nodes[i].getClientRects().length > 0) { return true; }"
+        "}"
+        "return false;"
+    )
+
+    def _execution_indicators_present(self) -> bool:
+        """Check whether any execution indicator is currently visible."""
+        try:
+            return bool(self.driver.execute_script(
+                self._INDICATORS_VISIBLE_JS, ", ".join(self.EXECUTION_INDICATORS)))
+        except Exception:
+            # Fall back to per-selector DOM queries if the script fails
+            for indicator_selector in self.EXECUTION_INDICATORS:
+                try:
+                    indicators = self.driver.find_elements(By.CSS_SELECTOR, indicator_selector)
+                    if indicators and any(indicator.is_displayed() for indicator in indicators):
+                        return True
+                except Exception:
+                    continue
+            return False
+
     def _wait_for_execution_complete_with_timeout(self) -> Tuple[str, Optional[str]]:
         """Wait for cell execution to complete with improved timeout handling."""
         try:
@@ -1096,26 +1144,22 @@ class ColabSeleniumManager:
             start_check_timeout = 15
             start_check_start = time.time()
             
+            # Adaptive polling: start fast to catch short executions, then
+            # back off geometrically to reduce WebDriver round trips
+            poll_interval = 0.05
             while time.time() - start_check_start < start_check_timeout:
                 # Check if total time limit is exceeded
                 if time.time() - start_time > max_wait_time:
                     self.logger.warning("Total timeout exceeded while waiting for execution to start")
                     break
-                    
-                for indicator_selector in self.EXECUTION_INDICATORS:
-                    try:
-                        indicators = self.driver.find_elements(By.CSS_SELECTOR, indicator_selector)
-                        if indicators and any(indicator.is_displayed() for indicator in indicators):
-                            execution_started = True
-                            self.logger.debug(f"Execution started, found indicator: {indicator_selector}")
-                            break
-                    except Exception:
-                        continue
-                
-                if execution_started:
+
+                if self._execution_indicators_present():
+                    execution_started = True
+                    self.logger.debug("Execution started, indicator visible")
                     break
-                
-                time.sleep(0.5)
+
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 1.5, 2.0)
             
             # If no execution indicator found, assume execution started immediately
             if not execution_started:
@@ -1129,7 +1173,8 @@ class ColabSeleniumManager:
             required_clear_checks = 2  # Reduced from 3 to 2 for faster response
             last_output_check = time.time()
             output_check_interval = 5  # Check output every 5 seconds during long executions
-            
+            poll_interval = 0.05  # Restart the adaptive backoff for completion polling
+
             while time.time() - completion_check_start < max_wait_time:
                 current_time = time.time()
                 
@@ -1145,17 +1190,7 @@ class ColabSeleniumManager:
                         pass  # Continue monitoring
                 
                 # Check if any execution indicators are still present
-                indicators_present = False
-                for indicator_selector in self.EXECUTION_INDICATORS:
-                    try:
-                        indicators = self.driver.find_elements(By.CSS_SELECTOR, indicator_selector)
-                        if indicators and any(indicator.is_displayed() for indicator in indicators):
-                            indicators_present = True
-                            break
-                    except Exception:
-                        continue
-                
-                if not indicators_present:
+                if not self._execution_indicators_present():
                     consecutive_clear_checks += 1
                     if consecutive_clear_checks >= required_clear_checks:
                         execution_completed = True
@@ -1163,8 +1198,9 @@ class ColabSeleniumManager:
                         break
                 else:
                     consecutive_clear_checks = 0  # Reset counter if indicators are found
-                
-                time.sleep(1)  # Check every second
+
+                time.sleep(poll_interval)
+                poll_interval = min(poll_interval * 1.5, 2.0)
             
             if not execution_completed:
                 self.logger.warning(f"Execution timeout after {max_wait_time} seconds - extracting available output")
@@ -1179,7 +1215,10 @@ class ColabSeleniumManager:
             return output, error
             
         except Exception as e:
-            self.logger.error(f"Error waiting for execution: {e}", exc_info=True)
+            # Only capture the traceback when DEBUG is on; this path can
+            # fire once per polling pass on flaky pages
+            self.logger.error(f"Error waiting for execution: {e}",
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
             # Always try to extract what we can
             try:
                 output, error = self._extract_cell_output_safe()
@@ -1472,7 +1511,8 @@ class ColabSeleniumManager:
             return output_text, error_text
             
         except Exception as e:
-            self.logger.error(f"Error in comprehensive output extraction: {e}", exc_info=True)
+            self.logger.error(f"Error in comprehensive output extraction: {e}",
+                              exc_info=self.logger.isEnabledFor(logging.DEBUG))
             return "", f"Output extraction failed: {str(e)}"
     
     def _wait_for_execution_complete(self) -> Tuple[str, Optional[str]]:
@@ -1639,26 +1679,35 @@ except ImportError:
     def check_session_health(self) -> bool:
         """Check if the current browser session is healthy and responsive."""
         if not self.driver:
+            self._last_health_ok_at = 0.0
             return False
-        
+
+        # Trust a recent successful probe instead of hitting the browser
+        # again; callers on the request hot path may check per request
+        if time.monotonic() - self._last_health_ok_at < self.health_cache_ttl:
+            return True
+
         try:
             # Test basic browser responsiveness
             current_url = self.driver.current_url
             page_title = self.driver.title
-            
+
             # Check if we're still on a Colab page
             if "colab.research.google.com" not in current_url:
                 self.logger.warning(f"Browser navigated away from Colab: {current_url}")
+                self._last_health_ok_at = 0.0
                 return False
-            
+
             # Test basic DOM interaction
             self.driver.find_element(By.TAG_NAME, "body")
-            
+
             self.logger.debug("Browser session health check passed")
+            self._last_health_ok_at = time.monotonic()
             return True
-            
+
         except Exception as e:
             self.logger.warning(f"Browser session health check failed: {e}")
+            self._last_health_ok_at = 0.0
             return False
     
     def cleanup_if_unhealthy(self) -> bool:
@@ -20,6 +20,9 @@ class ColabDiagnostics:
         """Initialize diagnostics."""
         self.config = config
         self.logger = logging.getLogger(__name__)
+        # Cached WebDriver probe result; the probe launches real browser
+        # processes, so it runs at most once per instance
+        self._webdriver_probe: Optional[Dict[str, Any]] = None
     
     def run_full_diagnostics(self) -> Dict[str, Any]:
         """Run comprehensive diagnostics."""
@@ -37,7 +40,15 @@ class ColabDiagnostics:
         return results
     
     def _test_webdriver_creation(self) -> Dict[str, Any]:
-        """Test WebDriver creation with different configurations."""
+        """Test WebDriver creation with different configurations.
+
+        Each probe cold-starts up to four browser processes (seconds
+        apiece), so the result is memoized for the lifetime of this
+        instance; repeat calls return the cached dict.
+        """
+        if self._webdriver_probe is not None:
+            return self._webdriver_probe
+
         results = {
             "chrome_regular": False,
             "chrome_headless": False,
@@ -86,7 +97,8 @@ class ColabDiagnostics:
             results["firefox"] = True
         except Exception as e:
             results["errors"].append(f"Firefox: {str(e)}")
-        
+
+        self._webdriver_probe = results
         return results
     
     def _test_colab_access(self) -> Dict[str, Any]:
@@ -24,7 +24,7 @@ from mcp.types import (
 from .auth_manager import AuthManager
 from .colab_drive import ColabDriveManager
 from .colab_selenium import ColabSeleniumManager
-from .session_manager import SessionManager, RuntimeType
+from .session_manager import SessionManager, RuntimeType, SessionInfoView
 from .utils import load_config, setup_logging, extract_error_message, safe_message_format
 
 
@@ -583,6 +583,10 @@ class ColabMCPServer:
         def safe_format_recursive(obj):
             if isinstance(obj, dict):
                 return {k: safe_format_recursive(v) for k, v in obj.items()}
+            elif isinstance(obj, SessionInfoView):
+                # Session info is a slotted mapping-like view; materialize
+                # it here, at the serialization boundary
+                return {k: safe_format_recursive(obj[k]) for k in obj.keys()}
             elif isinstance(obj, list):
                 return [safe_format_recursive(item) for item in obj]
             elif isinstance(obj, str):
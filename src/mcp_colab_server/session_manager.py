@@ -1,11 +1,21 @@
 """Session management for Google Colab interactions."""
 
+import heapq
 import logging
+import sys
 import time
-from typing import Dict, Optional, Any, List
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
+# Clock indirection: all timestamp reads in this module go through _now so
+# tests can install a fake clock without patching time.time globally. Wall
+# time (not monotonic) is kept deliberately - callers and tests compare
+# these stamps against time.time().
+_now = time.time
+
 
 class RuntimeType(Enum):
     """Colab runtime types."""
@@ -23,28 +33,81 @@ class SessionStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+# Pre-interned enum -> value-string maps so the serialization paths skip
+# the Enum descriptor machinery on every call; interning keeps repeated
+# JSON dumps of these strings on the short-string fast path
+_STATUS_NAMES = {status: sys.intern(status.value) for status in SessionStatus}
+_RUNTIME_NAMES = {runtime: sys.intern(runtime.value) for runtime in RuntimeType}
+
+
+@dataclass(slots=True)
 class ColabSession:
     """Represents a Colab session."""
     notebook_id: str
     session_id: Optional[str] = None
-    status: SessionStatus = SessionStatus.DISCONNECTED
+    _status: SessionStatus = field(default=SessionStatus.DISCONNECTED, repr=False)
     runtime_type: RuntimeType = RuntimeType.CPU
-    last_activity: float = 0.0
+    _last_activity: float = field(default=0.0, repr=False)
     connection_time: Optional[float] = None
     error_message: Optional[str] = None
     execution_start_time: Optional[float] = None  # Track execution start
     execution_timeout: float = 300.0  # Default 5 minutes
     is_long_running: bool = False  # Flag for long-running executions
-    
+    # Set by SessionManager so activity updates keep its idle index fresh
+    _on_activity: Optional[Callable[["ColabSession"], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    # Set by SessionManager so status transitions keep its connected set fresh
+    _on_status: Optional[
+        Callable[["ColabSession", SessionStatus, SessionStatus], None]
+    ] = field(default=None, repr=False, compare=False)
+
     def __post_init__(self):
         """Initialize timestamps."""
-        if self.last_activity == 0.0:
-            self.last_activity = time.time()
+        if self._last_activity == 0.0:
+            self._last_activity = _now()
+
+    def reset(self, notebook_id: str, runtime_type: RuntimeType = RuntimeType.CPU) -> None:
+        """Re-initialize a pooled session in place for a new notebook."""
+        self.notebook_id = notebook_id
+        self.session_id = None
+        self._status = SessionStatus.DISCONNECTED
+        self.runtime_type = runtime_type
+        self._last_activity = _now()
+        self.connection_time = None
+        self.error_message = None
+        self.execution_start_time = None
+        self.execution_timeout = 300.0
+        self.is_long_running = False
+        self._on_activity = None
+        self._on_status = None
+
+    @property
+    def status(self) -> SessionStatus:
+        """Current session status."""
+        return self._status
+
+    @status.setter
+    def status(self, value: SessionStatus) -> None:
+        old = self._status
+        self._status = value
+        if old is not value and self._on_status is not None:
+            self._on_status(self, old, value)
+
+    @property
+    def last_activity(self) -> float:
+        """Timestamp of the session's most recent activity."""
+        return self._last_activity
+
+    @last_activity.setter
+    def last_activity(self, value: float) -> None:
+        self._last_activity = value
+        if self._on_activity is not None:
+            self._on_activity(self)
     
     def start_execution(self, is_long_running: bool = False) -> None:
         """Mark the start of code execution."""
-        self.execution_start_time = time.time()
+        self.execution_start_time = _now()
         self.is_long_running = is_long_running
         self.status = SessionStatus.BUSY
     
@@ -52,13 +115,13 @@ class ColabSession:
         """Mark the end of code execution."""
         self.execution_start_time = None
         self.is_long_running = False
-        if self.status == SessionStatus.BUSY:
+        if self.status is SessionStatus.BUSY:
             self.status = SessionStatus.CONNECTED
     
     def get_execution_duration(self) -> Optional[float]:
         """Get current execution duration if executing."""
         if self.execution_start_time:
-            return time.time() - self.execution_start_time
+            return _now() - self.execution_start_time
         return None
     
     def is_execution_timeout(self) -> bool:
@@ -67,6 +130,38 @@ class ColabSession:
         return duration is not None and duration > self.execution_timeout
 
 
+class SessionInfoView(Mapping):
+    """Mapping snapshot of a session's info without dict costs.
+
+    Deriving from collections.abc.Mapping makes the view a drop-in
+    replacement for the dict get_session_info used to return: the three
+    methods below give it get()/items()/values()/keys() and the `in`
+    operator for free, and dict(view) converts it wherever a real dict
+    is required (e.g. before JSON serialization).
+    """
+
+    __slots__ = (
+        'notebook_id', 'session_id', 'status', 'runtime_type', 'idle_time',
+        'connection_duration', 'is_idle', 'is_connected', 'error_message',
+        'execution'
+    )
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __repr__(self):
+        return f"SessionInfoView({dict(self)!r})"
+
+
 class SessionManager:
     """Manages Colab sessions and their lifecycle."""
     
@@ -76,21 +171,65 @@ class SessionManager:
         self.colab_config = config.get("colab", {})
         self.sessions: Dict[str, ColabSession] = {}
         self.logger = logging.getLogger(__name__)
-        
+
         # Configuration
         self.max_idle_time = self.colab_config.get("max_idle_time", 3600)  # 1 hour
         self.connection_timeout = self.colab_config.get("connection_timeout", 60)
         self.max_retries = self.colab_config.get("max_retries", 3)
+
+        # Deadline indexes so the cleanup sweeps pop only expired entries
+        # (O(k log n)) instead of scanning every session per tick. Entries
+        # are lazily deleted: a bumped or removed session leaves a stale
+        # tuple behind that gets skipped when it surfaces.
+        self._idle_heap: List[Tuple[float, str]] = []
+        self._exec_heap: List[Tuple[float, str]] = []
+
+        # Bounded free-list of ColabSession objects so notebooks cycling
+        # through create/cleanup reuse instances instead of allocating
+        self._pool: deque = deque(maxlen=128)
+
+        # Ids of sessions currently in CONNECTED state, maintained on every
+        # status transition so active-count queries don't rescan the table
+        self._connected: set = set()
+
+    def _note_activity(self, session: ColabSession) -> None:
+        """Record a session's new idle deadline in the idle heap."""
+        heapq.heappush(
+            self._idle_heap,
+            (session.last_activity + self.max_idle_time, session.notebook_id)
+        )
+
+    def _note_execution_start(self, session: ColabSession) -> None:
+        """Record a session's execution deadline in the execution heap."""
+        if session.execution_start_time is not None:
+            heapq.heappush(
+                self._exec_heap,
+                (session.execution_start_time + session.execution_timeout, session.notebook_id)
+            )
+
+    def _note_status(self, session: ColabSession, old: SessionStatus, new: SessionStatus) -> None:
+        """Keep the connected-id set in sync with a status transition."""
+        if new is SessionStatus.CONNECTED:
+            self._connected.add(session.notebook_id)
+        elif old is SessionStatus.CONNECTED:
+            self._connected.discard(session.notebook_id)
     
     def create_session(self, notebook_id: str, runtime_type: RuntimeType = RuntimeType.CPU) -> ColabSession:
         """Create a new Colab session."""
-        session = ColabSession(
-            notebook_id=notebook_id,
-            runtime_type=runtime_type,
-            status=SessionStatus.DISCONNECTED
-        )
-        
+        if self._pool:
+            session = self._pool.popleft()
+            session.reset(notebook_id, runtime_type)
+        else:
+            session = ColabSession(
+                notebook_id=notebook_id,
+                runtime_type=runtime_type
+            )
+        session._on_activity = self._note_activity
+        session._on_status = self._note_status
+
+        self._connected.discard(notebook_id)  # new session starts disconnected
         self.sessions[notebook_id] = session
+        self._note_activity(session)
         self.logger.info(f"Created session for notebook {notebook_id}")
         
         return session
@@ -110,15 +249,16 @@ class SessionManager:
         """Update session status."""
         session = self.get_session(notebook_id)
         if session:
+            now = _now()
             session.status = status
-            session.last_activity = time.time()
-            
-            if status == SessionStatus.CONNECTED and session.connection_time is None:
-                session.connection_time = time.time()
-            elif status == SessionStatus.ERROR:
+            session.last_activity = now
+
+            if status is SessionStatus.CONNECTED and session.connection_time is None:
+                session.connection_time = now
+            elif status is SessionStatus.ERROR:
                 session.error_message = error_message
             
-            self.logger.info(f"Session {notebook_id} status updated to {status.value}")
+            self.logger.info(f"Session {notebook_id} status updated to {_STATUS_NAMES[status]}")
     
     def mark_execution_start(self, notebook_id: str, is_long_running: bool = False, custom_timeout: Optional[float] = None) -> None:
         """Mark the start of code execution for a session."""
@@ -126,6 +266,7 @@ class SessionManager:
         if custom_timeout:
             session.execution_timeout = custom_timeout
         session.start_execution(is_long_running)
+        self._note_execution_start(session)
         self.logger.info(f"Execution started for session {notebook_id} (long_running: {is_long_running})")
     
     def mark_execution_end(self, notebook_id: str) -> None:
@@ -147,114 +288,147 @@ class SessionManager:
         session = self.get_session(notebook_id)
         if not session:
             return {"executing": False, "error": "Session not found"}
-        
+
+        return self._execution_status(session)
+
+    def _execution_status(self, session: ColabSession) -> Dict[str, Any]:
+        """Build the execution-status payload for an already-resolved session."""
         is_executing = session.execution_start_time is not None
         duration = session.get_execution_duration()
         is_timeout = session.is_execution_timeout()
-        
+
         return {
             "executing": is_executing,
             "duration": duration,
             "timeout": session.execution_timeout,
             "is_timeout": is_timeout,
             "is_long_running": session.is_long_running,
-            "status": session.status.value
+            "status": _STATUS_NAMES[session.status]
         }
     
     def cleanup_timed_out_executions(self) -> List[str]:
         """Clean up sessions with timed-out executions."""
         timed_out_sessions = []
-        
-        for notebook_id, session in self.sessions.items():
-            if session.is_execution_timeout():
-                self.logger.warning(f"Execution timeout detected for session {notebook_id}")
-                session.end_execution()
-                session.status = SessionStatus.CONNECTED  # Reset to connected state
-                session.error_message = f"Execution timed out after {session.execution_timeout} seconds"
-                timed_out_sessions.append(notebook_id)
-        
+        now = _now()
+        # Hoist attribute lookups out of the pop loop
+        exec_heap = self._exec_heap
+        get_session = self.sessions.get
+
+        while exec_heap and exec_heap[0][0] <= now:
+            deadline, notebook_id = heapq.heappop(exec_heap)
+            session = get_session(notebook_id)
+            if session is None or session.execution_start_time is None:
+                continue  # stale entry: session removed or execution finished
+            if session.execution_start_time + session.execution_timeout > now:
+                continue  # execution restarted; a fresher entry is queued
+
+            self.logger.warning(f"Execution timeout detected for session {notebook_id}")
+            session.end_execution()
+            session.status = SessionStatus.CONNECTED  # Reset to connected state
+            session.error_message = f"Execution timed out after {session.execution_timeout} seconds"
+            timed_out_sessions.append(notebook_id)
+
         return timed_out_sessions
     
     def mark_session_active(self, notebook_id: str) -> None:
         """Mark session as active (update last activity time)."""
         session = self.get_session(notebook_id)
         if session:
-            session.last_activity = time.time()
+            session.last_activity = _now()
     
+    def _is_idle(self, session: ColabSession, now: float) -> bool:
+        """Check idleness for an already-resolved session."""
+        return now - session.last_activity > self.max_idle_time
+
+    def _is_connected(self, session: ColabSession, now: float) -> bool:
+        """Check connectedness for an already-resolved session."""
+        return (
+            session.status is SessionStatus.CONNECTED
+            and not self._is_idle(session, now)
+        )
+
     def is_session_idle(self, notebook_id: str) -> bool:
         """Check if session is idle (inactive for too long)."""
         session = self.get_session(notebook_id)
         if not session:
             return True
-        
-        idle_time = time.time() - session.last_activity
-        return idle_time > self.max_idle_time
-    
+
+        return self._is_idle(session, _now())
+
     def is_session_connected(self, notebook_id: str) -> bool:
         """Check if session is connected and active."""
         session = self.get_session(notebook_id)
         if not session:
             return False
-        
-        return (
-            session.status == SessionStatus.CONNECTED and 
-            not self.is_session_idle(notebook_id)
-        )
+
+        return self._is_connected(session, _now())
     
     def cleanup_idle_sessions(self) -> int:
         """Clean up idle sessions and return count of cleaned sessions."""
-        current_time = time.time()
-        idle_sessions = []
-        
-        for notebook_id, session in self.sessions.items():
-            idle_time = current_time - session.last_activity
-            if idle_time > self.max_idle_time:
-                idle_sessions.append(notebook_id)
-        
-        for notebook_id in idle_sessions:
+        current_time = _now()
+        cleaned_count = 0
+        # Hoist attribute lookups out of the pop loop
+        idle_heap = self._idle_heap
+        get_session = self.sessions.get
+        max_idle_time = self.max_idle_time
+
+        while idle_heap and idle_heap[0][0] <= current_time:
+            deadline, notebook_id = heapq.heappop(idle_heap)
+            session = get_session(notebook_id)
+            if session is None:
+                continue  # stale entry for an already-removed session
+            if session.last_activity + max_idle_time > current_time:
+                continue  # activity was bumped; a fresher entry is queued
+
             self.remove_session(notebook_id)
             self.logger.info(f"Cleaned up idle session: {notebook_id}")
-        
-        return len(idle_sessions)
+            cleaned_count += 1
+
+        return cleaned_count
     
     def remove_session(self, notebook_id: str) -> bool:
         """Remove a session."""
-        if notebook_id in self.sessions:
-            del self.sessions[notebook_id]
+        session = self.sessions.pop(notebook_id, None)
+        if session is not None:
+            # Clear references before pooling so recycled objects don't
+            # pin large strings or keep stamping the idle heap
+            session.session_id = None
+            session.error_message = None
+            session._on_activity = None
+            session._on_status = None
+            self._connected.discard(notebook_id)
+            self._pool.append(session)
             self.logger.info(f"Removed session: {notebook_id}")
             return True
         return False
     
-    def get_session_info(self, notebook_id: str) -> Optional[Dict[str, Any]]:
+    def get_session_info(self, notebook_id: str) -> Optional[SessionInfoView]:
         """Get comprehensive session information including execution status."""
         session = self.get_session(notebook_id)
         if not session:
             return None
-        
-        current_time = time.time()
-        idle_time = current_time - session.last_activity
-        connection_duration = None
-        
-        if session.connection_time:
-            connection_duration = current_time - session.connection_time
-        
-        # Get execution information
-        execution_info = self.get_execution_status(notebook_id)
-        
-        return {
-            'notebook_id': session.notebook_id,
-            'session_id': session.session_id,
-            'status': session.status.value,
-            'runtime_type': session.runtime_type.value,
-            'idle_time': idle_time,
-            'connection_duration': connection_duration,
-            'is_idle': self.is_session_idle(notebook_id),
-            'is_connected': self.is_session_connected(notebook_id),
-            'error_message': session.error_message,
-            'execution': execution_info
-        }
-    
-    def list_sessions(self) -> List[Dict[str, Any]]:
+
+        # Resolve the session and the clock once; the per-field checks all
+        # operate on the same object and timestamp
+        current_time = _now()
+
+        view = SessionInfoView()
+        view.notebook_id = session.notebook_id
+        view.session_id = session.session_id
+        view.status = _STATUS_NAMES[session.status]
+        view.runtime_type = _RUNTIME_NAMES[session.runtime_type]
+        view.idle_time = current_time - session.last_activity
+        view.connection_duration = (
+            current_time - session.connection_time
+            if session.connection_time else None
+        )
+        view.is_idle = self._is_idle(session, current_time)
+        view.is_connected = self._is_connected(session, current_time)
+        view.error_message = session.error_message
+        view.execution = self._execution_status(session)
+        return view
+
+    def list_sessions(self) -> List[SessionInfoView]:
         """List all sessions with their information."""
         sessions_info = []
         for notebook_id in self.sessions:
@@ -266,11 +440,14 @@ class SessionManager:
     
     def get_active_sessions_count(self) -> int:
         """Get count of active (connected) sessions."""
-        count = 0
-        for notebook_id in self.sessions:
-            if self.is_session_connected(notebook_id):
-                count += 1
-        return count
+        # Only the incrementally maintained connected set needs checking;
+        # idleness still has to be evaluated against the current clock
+        now = _now()
+        return sum(
+            1 for notebook_id in self._connected
+            if (session := self.sessions.get(notebook_id)) is not None
+            and now - session.last_activity <= self.max_idle_time
+        )
     
     def set_session_id(self, notebook_id: str, session_id: str) -> None:
         """Set the session ID for a notebook."""
@@ -286,7 +463,7 @@ class SessionManager:
             return False
         
         # Reconnect if disconnected or in error state
-        if session.status in [SessionStatus.DISCONNECTED, SessionStatus.ERROR]:
+        if session.status in (SessionStatus.DISCONNECTED, SessionStatus.ERROR):
             return True
         
         # Reconnect if idle for too long
@@ -302,8 +479,8 @@ class SessionManager:
             return {}
         
         return {
-            'runtime_type': session.runtime_type.value,
-            'status': session.status.value,
-            'available_types': [rt.value for rt in RuntimeType],
-            'recommended_type': RuntimeType.CPU.value  # Default recommendation
+            'runtime_type': _RUNTIME_NAMES[session.runtime_type],
+            'status': _STATUS_NAMES[session.status],
+            'available_types': list(_RUNTIME_NAMES.values()),
+            'recommended_type': _RUNTIME_NAMES[RuntimeType.CPU]  # Default recommendation
         }
\ No newline at end of file
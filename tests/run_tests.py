@@ -1,24 +1,47 @@
 """Test runner for the Google Colab MCP server."""
 
+import io
 import sys
 import unittest
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+
+def _run_suite(suite):
+    """Run a single per-module suite against a buffered runner."""
+    stream = io.StringIO()
+    runner = unittest.TextTestRunner(stream=stream, verbosity=2)
+    result = runner.run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+
 def run_tests():
-    """Run all tests."""
-    # Discover and run tests
+    """Run all tests, overlapping independent test modules."""
+    # Discover tests grouped per module
     loader = unittest.TestLoader()
     start_dir = os.path.dirname(__file__)
     suite = loader.discover(start_dir, pattern='test_*.py')
-    
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    return result.wasSuccessful()
+
+    module_suites = [s for s in suite if s.countTestCases()]
+    if not module_suites:
+        return True
+
+    # The modules are independent and mostly I/O-bound, so run them
+    # concurrently instead of serially in a single runner. Each worker
+    # gets its own runner writing to a buffer to keep output readable.
+    max_workers = min(len(module_suites), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(_run_suite, module_suites))
+
+    for _, output in results:
+        sys.stderr.write(output)
+
+    return all(successful for successful, _ in results)
+
 
 if __name__ == '__main__':
     success = run_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -2,24 +2,53 @@
 
 import json
 import os
+import sys
 import tempfile
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 
-from src.auth_manager import AuthManager
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mcp_colab_server.auth_manager import AuthManager
 
 
 class TestAuthManager(unittest.TestCase):
     """Test cases for AuthManager."""
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Create the static fixtures (credentials file) once for the class."""
+        cls.base_dir = tempfile.mkdtemp()
+        cls.credentials_file = os.path.join(cls.base_dir, "credentials.json")
+
+        # Create mock credentials file; tests treat this as read-only
+        mock_credentials = {
+            "installed": {
+                "client_id": "test_client_id",
+                "client_secret": "test_client_secret",
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token"
+            }
+        }
+
+        with open(cls.credentials_file, 'w') as f:
+            json.dump(mock_credentials, f)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up the shared fixture directory."""
+        import shutil
+        shutil.rmtree(cls.base_dir)
+
     def setUp(self):
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        """Set up per-test fixtures (config + token paths only)."""
+        self.temp_dir = tempfile.mkdtemp(dir=self.base_dir)
         self.config_file = os.path.join(self.temp_dir, "test_config.json")
-        self.credentials_file = os.path.join(self.temp_dir, "credentials.json")
         self.token_file = os.path.join(self.temp_dir, "token.json")
-        
-        # Create test config
+
+        # Per-test config referencing the shared credentials file and the
+        # per-test token file (the only file tests actually mutate)
         test_config = {
             "google_api": {
                 "scopes": ["https://www.googleapis.com/auth/drive"],
@@ -27,38 +56,25 @@ class TestAuthManager(unittest.TestCase):
                 "token_file": self.token_file
             }
         }
-        
+
         with open(self.config_file, 'w') as f:
             json.dump(test_config, f)
-        
-        # Create mock credentials file
-        mock_credentials = {
-            "installed": {
-                "client_id": "test_client_id",
-                "client_secret": "test_client_secret",
-                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                "token_uri": "https://oauth2.googleapis.com/token"
-            }
-        }
-        
-        with open(self.credentials_file, 'w') as f:
-            json.dump(mock_credentials, f)
-    
+
     def tearDown(self):
-        """Clean up test fixtures."""
+        """Clean up per-test fixtures."""
         import shutil
         shutil.rmtree(self.temp_dir)
     
     def test_init(self):
         """Test AuthManager initialization."""
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         
         self.assertEqual(auth_manager.credentials_file, self.credentials_file)
         self.assertEqual(auth_manager.token_file, self.token_file)
         self.assertIn("https://www.googleapis.com/auth/drive", auth_manager.scopes)
         self.assertIsNone(auth_manager.credentials)
     
-    @patch('src.auth_manager.Credentials')
+    @patch('mcp_colab_server.auth_manager.Credentials')
     def test_authenticate_with_existing_valid_token(self, mock_credentials_class):
         """Test authentication with existing valid token."""
         # Mock existing valid credentials
@@ -70,15 +86,15 @@ class TestAuthManager(unittest.TestCase):
         with open(self.token_file, 'w') as f:
             json.dump({"token": "test_token"}, f)
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         result = auth_manager.authenticate()
         
         self.assertTrue(result)
         self.assertEqual(auth_manager.credentials, mock_creds)
         mock_credentials_class.from_authorized_user_file.assert_called_once()
     
-    @patch('src.auth_manager.Request')
-    @patch('src.auth_manager.Credentials')
+    @patch('mcp_colab_server.auth_manager.Request')
+    @patch('mcp_colab_server.auth_manager.Credentials')
     def test_authenticate_with_expired_token(self, mock_credentials_class, mock_request):
         """Test authentication with expired token that can be refreshed."""
         # Mock expired credentials that can be refreshed
@@ -92,7 +108,7 @@ class TestAuthManager(unittest.TestCase):
         with open(self.token_file, 'w') as f:
             json.dump({"token": "test_token"}, f)
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         
         # Mock the refresh process
         def refresh_side_effect(request):
@@ -106,8 +122,8 @@ class TestAuthManager(unittest.TestCase):
         self.assertTrue(result)
         mock_creds.refresh.assert_called_once()
     
-    @patch('src.auth_manager.InstalledAppFlow')
-    @patch('src.auth_manager.Credentials')
+    @patch('mcp_colab_server.auth_manager.InstalledAppFlow')
+    @patch('mcp_colab_server.auth_manager.Credentials')
     def test_authenticate_new_user(self, mock_credentials_class, mock_flow_class):
         """Test authentication for new user (no existing token)."""
         # Mock no existing credentials
@@ -120,7 +136,7 @@ class TestAuthManager(unittest.TestCase):
         mock_flow.run_local_server.return_value = mock_creds
         mock_flow_class.from_client_secrets_file.return_value = mock_flow
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         
         with patch.object(auth_manager, '_save_credentials'):
             result = auth_manager.authenticate()
@@ -132,22 +148,32 @@ class TestAuthManager(unittest.TestCase):
     
     def test_authenticate_missing_credentials_file(self):
         """Test authentication fails when credentials file is missing."""
-        # Remove credentials file
-        os.remove(self.credentials_file)
-        
-        auth_manager = AuthManager(self.config_file)
+        # Point the config at a credentials file that doesn't exist
+        # (the shared credentials fixture is read-only, so don't remove it)
+        config_file = os.path.join(self.temp_dir, "missing_creds_config.json")
+        test_config = {
+            "google_api": {
+                "scopes": ["https://www.googleapis.com/auth/drive"],
+                "credentials_file": os.path.join(self.temp_dir, "nonexistent.json"),
+                "token_file": self.token_file
+            }
+        }
+        with open(config_file, 'w') as f:
+            json.dump(test_config, f)
+
+        auth_manager = AuthManager(config_path=config_file)
         result = auth_manager.authenticate()
-        
+
         self.assertFalse(result)
     
-    @patch('src.auth_manager.build')
+    @patch('mcp_colab_server.auth_manager.build')
     def test_get_drive_service(self, mock_build):
         """Test getting Drive service."""
         # Mock authenticated credentials
         mock_creds = Mock()
         mock_creds.valid = True
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         auth_manager.credentials = mock_creds
         
         mock_service = Mock()
@@ -160,7 +186,7 @@ class TestAuthManager(unittest.TestCase):
     
     def test_get_drive_service_not_authenticated(self):
         """Test getting Drive service when not authenticated."""
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         
         with patch.object(auth_manager, 'authenticate', return_value=False):
             with self.assertRaises(Exception):
@@ -168,7 +194,7 @@ class TestAuthManager(unittest.TestCase):
     
     def test_is_authenticated(self):
         """Test authentication status check."""
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         
         # Not authenticated initially
         self.assertFalse(auth_manager.is_authenticated())
@@ -184,7 +210,7 @@ class TestAuthManager(unittest.TestCase):
         mock_creds.valid = False
         self.assertFalse(auth_manager.is_authenticated())
     
-    @patch('src.auth_manager.Request')
+    @patch('mcp_colab_server.auth_manager.Request')
     def test_revoke_credentials(self, mock_request):
         """Test credential revocation."""
         # Create mock token file
@@ -194,7 +220,7 @@ class TestAuthManager(unittest.TestCase):
         # Mock credentials
         mock_creds = Mock()
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         auth_manager.credentials = mock_creds
         
         result = auth_manager.revoke_credentials()
@@ -209,7 +235,7 @@ class TestAuthManager(unittest.TestCase):
         mock_creds = Mock()
         mock_creds.to_json.return_value = '{"token": "test_token"}'
         
-        auth_manager = AuthManager(self.config_file)
+        auth_manager = AuthManager(config_path=self.config_file)
         auth_manager.credentials = mock_creds
         
         auth_manager._save_credentials()
@@ -19,6 +19,16 @@ sys.path.insert(0, str(src_path))
 from mcp_colab_server.server import ColabMCPServer
 
 
+async def _wait_until(predicate, timeout=5.0, interval=0.1):
+    """Wait until predicate() is true, polling without blocking the loop."""
+    deadline = time.time() + timeout
+    while not predicate():
+        if time.time() >= deadline:
+            return False
+        await asyncio.sleep(interval)
+    return True
+
+
 async def test_browser_cleanup_fixes():
     """Test browser cleanup fixes to prevent system crashes."""
     print("\n=== Testing Browser Cleanup Fixes ===")
@@ -49,33 +59,51 @@ async def test_browser_cleanup_fixes():
             }
         ]
         
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"\n   Test {i}: {test_case['name']}")
-            start_time = time.time()
-            
-            try:
+        # The cases are independent, so run them through asyncio.gather and
+        # let the event loop overlap their waits. Only one browser session
+        # exists today, so a Semaphore(1) serializes the actual executions;
+        # raise the limit if per-session parallelism ever lands.
+        execution_slot = asyncio.Semaphore(1)
+
+        async def _run_case(test_case):
+            async with execution_slot:
+                start_time = time.time()
                 result = await server._run_code_cell({
                     "code": test_case['code'],
                     "notebook_id": test_notebook_id,
                     "confirm_execution": True
                 })
-                
-                execution_time = time.time() - start_time
-                
-                if result.get('success'):
-                    print(f"   Success: {result.get('message', 'Code executed')}")
-                    print(f"   Execution time: {execution_time:.2f}s")
-                else:
-                    print(f"   Failed: {result.get('error', 'Unknown error')}")
-                    print(f"   Execution time: {execution_time:.2f}s")
-                
-                # Wait a bit between tests
-                time.sleep(2)
-                
-            except Exception as e:
                 execution_time = time.time() - start_time
-                print(f"   Exception: {e}")
-                print(f"   Time before exception: {execution_time:.2f}s")
+
+                # Wait until the browser session is ready again instead of
+                # a fixed (and loop-blocking) time.sleep(2)
+                await _wait_until(
+                    lambda: getattr(server, "selenium_manager", None) is None
+                    or server.selenium_manager.check_session_health()
+                )
+                return result, execution_time
+
+        started = time.time()
+        results = await asyncio.gather(
+            *[_run_case(tc) for tc in test_cases],
+            return_exceptions=True
+        )
+
+        for i, (test_case, outcome) in enumerate(zip(test_cases, results), 1):
+            print(f"\n   Test {i}: {test_case['name']}")
+
+            if isinstance(outcome, BaseException):
+                print(f"   Exception: {outcome}")
+                print(f"   Time before exception: {time.time() - started:.2f}s")
+                continue
+
+            result, execution_time = outcome
+            if result.get('success'):
+                print(f"   Success: {result.get('message', 'Code executed')}")
+                print(f"   Execution time: {execution_time:.2f}s")
+            else:
+                print(f"   Failed: {result.get('error', 'Unknown error')}")
+                print(f"   Execution time: {execution_time:.2f}s")
         
         print("\n3. Testing cleanup...")
         
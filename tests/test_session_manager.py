@@ -1,25 +1,45 @@
 """Tests for the SessionManager class."""
 
+import os
+import sys
 import time
 import unittest
 from unittest.mock import Mock, patch
 
-from src.session_manager import SessionManager, SessionStatus, RuntimeType, ColabSession
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mcp_colab_server.session_manager import SessionManager, SessionStatus, RuntimeType, ColabSession
 
 
 class TestSessionManager(unittest.TestCase):
     """Test cases for SessionManager."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.config = {
+    @classmethod
+    def setUpClass(cls):
+        """Build the manager once for the class; tests share the instance."""
+        cls.config = {
             "colab": {
                 "max_idle_time": 10,  # 10 seconds for testing
                 "connection_timeout": 5,
                 "max_retries": 3
             }
         }
-        self.session_manager = SessionManager(self.config)
+        cls.session_manager = SessionManager(cls.config)
+
+    def setUp(self):
+        """Reset the shared manager's state between tests.
+
+        Clearing the session table, deadline heaps and connected set is
+        all __init__ does beyond reading config, so this keeps tests
+        isolated without rebuilding the manager per method. The object
+        pool is deliberately left alone - reuse across tests is part of
+        its contract.
+        """
+        self.session_manager.sessions.clear()
+        self.session_manager._idle_heap.clear()
+        self.session_manager._exec_heap.clear()
+        self.session_manager._connected.clear()
     
     def test_create_session(self):
         """Test session creation."""
@@ -11,10 +11,12 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Resolve the src path once at module scope
+_SRC_PATH = str(Path(__file__).parent / "src")
+
 # Add src to path
 import sys
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
+sys.path.insert(0, _SRC_PATH)
 
 from mcp_colab_server.server import ColabMCPServer
 
@@ -57,42 +59,66 @@ async def test_smart_cleanup():
             }
         ]
         
+        # Tests 1, 3 and 4 are order-independent; only Test 5 relies on the
+        # kernel state left behind by Test 2. Overlap the independent cases
+        # on the event loop and keep the 2 -> 5 chain sequential. Only one
+        # browser session exists, so a Semaphore(1) serializes the actual
+        # executions; raise the limit if per-session parallelism ever lands.
+        execution_slot = asyncio.Semaphore(1)
+        outcomes = {}
+
+        async def _run_case(index):
+            test_case = test_cases[index]
+            async with execution_slot:
+                start_time = time.time()
+                try:
+                    result = await asyncio.wait_for(
+                        server._run_code_cell({
+                            "code": test_case["code"],
+                            "notebook_id": test_notebook_id,
+                            "confirm_execution": True
+                        }),
+                        timeout=30
+                    )
+                    outcomes[index] = (result, time.time() - start_time)
+                except Exception as e:
+                    outcomes[index] = (e, time.time() - start_time)
+                # Yield to the loop between executions instead of the old
+                # loop-blocking time.sleep(1)
+                await asyncio.sleep(0)
+
+        async def _run_chain(*indexes):
+            for index in indexes:
+                await _run_case(index)
+
+        await asyncio.gather(
+            _run_case(0),
+            _run_chain(1, 4),  # Test 5 checks variables defined by Test 2
+            _run_case(2),
+            _run_case(3),
+            return_exceptions=True
+        )
+
         success_count = 0
-        for i, test_case in enumerate(test_cases, 1):
+        for i, test_case in enumerate(test_cases):
             print(f"\n   Running {test_case['name']}...")
-            start_time = time.time()
-            
-            try:
-                # Execute code using the server's method
-                arguments = {
-                    "code": test_case["code"],
-                    "notebook_id": test_notebook_id,
-                    "confirm_execution": True
-                }
-                
-                result = await server._run_code_cell(arguments)
-                execution_time = time.time() - start_time
-                
-                if result.get('success', False):
-                    print(f"   ✅ Success: {test_case['name']}")
-                    print(f"   📊 Execution time: {execution_time:.2f}s")
-                    if result.get('output'):
-                        print(f"   📝 Output preview: {result['output'][:100]}...")
-                    success_count += 1
-                else:
-                    print(f"   ❌ Failed: {test_case['name']}")
-                    print(f"   📊 Execution time: {execution_time:.2f}s")
-                    if result.get('error'):
-                        print(f"   ❌ Error: {result['error']}")
-                
-                # Small delay between tests
-                time.sleep(1)
-                
-            except Exception as e:
-                execution_time = time.time() - start_time
-                print(f"   ❌ Exception in {test_case['name']}: {e}")
+            result, execution_time = outcomes.get(i, (None, 0.0))
+
+            if isinstance(result, BaseException):
+                print(f"   ❌ Exception in {test_case['name']}: {result}")
                 print(f"   📊 Time before exception: {execution_time:.2f}s")
-        
+            elif result is not None and result.get('success', False):
+                print(f"   ✅ Success: {test_case['name']}")
+                print(f"   📊 Execution time: {execution_time:.2f}s")
+                if result.get('output'):
+                    print(f"   📝 Output preview: {result['output'][:100]}...")
+                success_count += 1
+            else:
+                print(f"   ❌ Failed: {test_case['name']}")
+                print(f"   📊 Execution time: {execution_time:.2f}s")
+                if result is not None and result.get('error'):
+                    print(f"   ❌ Error: {result['error']}")
+
         print(f"\n3. Test Results Summary:")
         print(f"   ✅ Successful executions: {success_count}/{len(test_cases)}")
         print(f"   📈 Success rate: {(success_count/len(test_cases)*100):.1f}%")
@@ -127,7 +153,9 @@ async def test_smart_cleanup():
         
     except Exception as e:
         print(f"\nTest failed with error: {e}")
-        logger.exception("Smart cleanup test failed")
+        # Stack-trace formatting is not free; skip it when ERROR is off
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception("Smart cleanup test failed")
 
 
 def main():
@@ -145,7 +173,9 @@ def main():
         print("\nTest interrupted by user")
     except Exception as e:
         print(f"\nTest failed: {e}")
-        logger.exception("Test execution failed")
+        # Stack-trace formatting is not free; skip it when ERROR is off
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception("Test execution failed")
 
 
 if __name__ == "__main__":
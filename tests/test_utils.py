@@ -1,11 +1,19 @@
 """Tests for utility functions."""
 
+import asyncio
+import io
 import json
+import os
+import pathlib
+import sys
 import tempfile
 import unittest
 from unittest.mock import patch, Mock
 
-from src.utils import (
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from mcp_colab_server.utils import (
     load_config,
     validate_notebook_id,
     sanitize_filename,
@@ -15,7 +23,70 @@ from src.utils import (
     extract_error_message,
     is_valid_python_code,
     format_execution_time,
-    retry_with_backoff
+    retry_with_backoff,
+    aretry_with_backoff
+)
+
+
+# Parameter tables hoisted to module scope: built once at import instead
+# of per test run, and kept out of the test bodies so each case reads as
+# data. subTest keeps per-case reporting under both unittest discovery
+# (tests/run_tests.py) and pytest.
+_VALID_NOTEBOOK_IDS = (
+    "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
+    "1ABC123DEF456GHI789JKL012MNO345PQR678STU901VWX234YZ567",
+    "abc123-def456_ghi789"
+)
+
+_INVALID_NOTEBOOK_IDS = (
+    "",
+    None,
+    "too_short",
+    "contains/invalid/characters",
+    "contains spaces",
+    "a" * 100  # too long
+)
+
+_SANITIZE_FILENAME_CASES = (
+    ("normal_file.txt", "normal_file.txt"),
+    ("file with spaces.txt", "file with spaces.txt"),
+    ("file<>:\"/\\|?*.txt", "file_________.txt"),
+    ("  .hidden_file  ", "hidden_file"),
+    ("", "untitled"),
+    ("   ", "untitled"),
+    ("...", "untitled")
+)
+
+_EXTRACT_ERROR_MESSAGE_CASES = (
+    (Exception("Simple error"), "Simple error"),
+    (Exception("Message: Prefixed error"), "Prefixed error"),
+    (Exception("selenium.common.exceptions.TimeoutException: Timeout"), "TimeoutException: Timeout"),
+    (Exception("googleapiclient.errors.HttpError: 404 Not Found"), "HttpError: 404 Not Found")
+)
+
+_VALID_PYTHON_CODE = (
+    "print('hello')",
+    "x = 1\ny = 2\nprint(x + y)",
+    "def func():\n    return 42",
+    "import os\nprint(os.getcwd())"
+)
+
+_INVALID_PYTHON_CODE = (
+    "print('unclosed string",
+    "def func(\n    pass",
+    "if True\n    print('missing colon')",
+    "import"
+)
+
+_FORMAT_EXECUTION_TIME_CASES = (
+    (0.001, "1ms"),
+    (0.5, "500ms"),
+    (1.0, "1.0s"),
+    (1.234, "1.2s"),
+    (59.9, "59.9s"),
+    (60.0, "1m 0.0s"),
+    (65.5, "1m 5.5s"),
+    (125.7, "2m 5.7s")
 )
 
 
@@ -23,81 +94,59 @@ class TestUtils(unittest.TestCase):
     """Test cases for utility functions."""
     
     def test_load_config_valid_file(self):
-        """Test loading valid configuration file."""
+        """Test loading valid configuration from a file-like object."""
         config_data = {
             "server": {"host": "localhost", "port": 8080},
             "logging": {"level": "INFO"}
         }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            config_file = f.name
-        
-        try:
-            result = load_config(config_file)
-            self.assertEqual(result, config_data)
-        finally:
-            import os
-            os.unlink(config_file)
-    
+
+        result = load_config(io.StringIO(json.dumps(config_data)))
+        self.assertEqual(result, config_data)
+
+    def test_load_config_valid_path(self):
+        """Test loading valid configuration from a file path."""
+        config_data = {
+            "server": {"host": "localhost", "port": 8080},
+            "logging": {"level": "INFO"}
+        }
+
+        # TemporaryDirectory cleans up on context exit - no delete=False
+        # plus manual os.unlink, which is also fragile on Windows
+        with tempfile.TemporaryDirectory() as td:
+            config_file = pathlib.Path(td, "config.json")
+            config_file.write_text(json.dumps(config_data))
+            self.assertEqual(load_config(str(config_file)), config_data)
+
     def test_load_config_missing_file(self):
-        """Test loading missing configuration file."""
+        """Test loading missing configuration file falls back to defaults."""
         result = load_config("nonexistent.json")
-        self.assertEqual(result, {})
-    
+
+        # A missing file yields the built-in default config the server
+        # starts from, not an empty dict
+        for section in ("server", "selenium", "colab", "google_api", "logging"):
+            self.assertIn(section, result)
+        self.assertEqual(result["colab"]["base_url"], "https://colab.research.google.com")
+
     def test_load_config_invalid_json(self):
-        """Test loading invalid JSON file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content")
-            config_file = f.name
-        
-        try:
-            result = load_config(config_file)
-            self.assertEqual(result, {})
-        finally:
-            import os
-            os.unlink(config_file)
+        """Test loading invalid JSON content."""
+        result = load_config(io.StringIO("invalid json content"))
+        self.assertEqual(result, {})
     
     def test_validate_notebook_id_valid(self):
         """Test validation of valid notebook IDs."""
-        valid_ids = [
-            "1BxiMVs0XRA5nFMdKvBdBZjgmUUqptlbs74OgvE2upms",
-            "1ABC123DEF456GHI789JKL012MNO345PQR678STU901VWX234YZ567",
-            "abc123-def456_ghi789"
-        ]
-        
-        for notebook_id in valid_ids:
+        for notebook_id in _VALID_NOTEBOOK_IDS:
             with self.subTest(notebook_id=notebook_id):
                 self.assertTrue(validate_notebook_id(notebook_id))
-    
+
     def test_validate_notebook_id_invalid(self):
         """Test validation of invalid notebook IDs."""
-        invalid_ids = [
-            "",
-            None,
-            "too_short",
-            "contains/invalid/characters",
-            "contains spaces",
-            "a" * 100  # too long
-        ]
-        
-        for notebook_id in invalid_ids:
+        for notebook_id in _INVALID_NOTEBOOK_IDS:
             with self.subTest(notebook_id=notebook_id):
                 self.assertFalse(validate_notebook_id(notebook_id))
-    
+
     def test_sanitize_filename(self):
         """Test filename sanitization."""
-        test_cases = [
-            ("normal_file.txt", "normal_file.txt"),
-            ("file with spaces.txt", "file with spaces.txt"),
-            ("file<>:\"/\\|?*.txt", "file_________.txt"),
-            ("  .hidden_file  ", "hidden_file"),
-            ("", "untitled"),
-            ("   ", "untitled"),
-            ("...", "untitled")
-        ]
-        
-        for input_name, expected in test_cases:
+        for input_name, expected in _SANITIZE_FILENAME_CASES:
             with self.subTest(input_name=input_name):
                 result = sanitize_filename(input_name)
                 self.assertEqual(result, expected)
@@ -147,56 +196,24 @@ class TestUtils(unittest.TestCase):
     
     def test_extract_error_message(self):
         """Test error message extraction."""
-        test_cases = [
-            (Exception("Simple error"), "Simple error"),
-            (Exception("Message: Prefixed error"), "Prefixed error"),
-            (Exception("selenium.common.exceptions.TimeoutException: Timeout"), "TimeoutException: Timeout"),
-            (Exception("googleapiclient.errors.HttpError: 404 Not Found"), "HttpError: 404 Not Found")
-        ]
-        
-        for error, expected in test_cases:
+        for error, expected in _EXTRACT_ERROR_MESSAGE_CASES:
             with self.subTest(error=str(error)):
                 result = extract_error_message(error)
                 self.assertEqual(result, expected)
-    
+
     def test_is_valid_python_code(self):
         """Test Python code validation."""
-        valid_code = [
-            "print('hello')",
-            "x = 1\ny = 2\nprint(x + y)",
-            "def func():\n    return 42",
-            "import os\nprint(os.getcwd())"
-        ]
-        
-        invalid_code = [
-            "print('unclosed string",
-            "def func(\n    pass",
-            "if True\n    print('missing colon')",
-            "import"
-        ]
-        
-        for code in valid_code:
+        for code in _VALID_PYTHON_CODE:
             with self.subTest(code=code):
                 self.assertTrue(is_valid_python_code(code))
-        
-        for code in invalid_code:
+
+        for code in _INVALID_PYTHON_CODE:
             with self.subTest(code=code):
                 self.assertFalse(is_valid_python_code(code))
-    
+
     def test_format_execution_time(self):
         """Test execution time formatting."""
-        test_cases = [
-            (0.001, "1ms"),
-            (0.5, "500ms"),
-            (1.0, "1.0s"),
-            (1.234, "1.2s"),
-            (59.9, "59.9s"),
-            (60.0, "1m 0.0s"),
-            (65.5, "1m 5.5s"),
-            (125.7, "2m 5.7s")
-        ]
-        
-        for seconds, expected in test_cases:
+        for seconds, expected in _FORMAT_EXECUTION_TIME_CASES:
             with self.subTest(seconds=seconds):
                 result = format_execution_time(seconds)
                 self.assertEqual(result, expected)
@@ -235,6 +252,50 @@ class TestUtils(unittest.TestCase):
         with self.assertRaises(Exception):
             always_failing_function()
 
+    def test_aretry_with_backoff_concurrent(self):
+        """Test async retry decorator overlaps backoff waits across coroutines."""
+        call_counts = {"first": 0, "second": 0}
+        sleep_log = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            # Record which task backs off for how long, then just yield
+            # control - the test asserts the overlap structurally instead
+            # of racing a wall clock, so it spends no time waiting and
+            # can't flake on a loaded CI worker
+            sleep_log.append((asyncio.current_task().get_name(), delay))
+            await real_sleep(0)
+
+        @aretry_with_backoff(max_retries=3, delay=0.1, jitter=0.0)
+        async def eventually_successful_coroutine(name):
+            call_counts[name] += 1
+            if call_counts[name] < 3:
+                raise Exception("Temporary failure")
+            return "success"
+
+        async def run_both():
+            return await asyncio.gather(
+                eventually_successful_coroutine("first"),
+                eventually_successful_coroutine("second")
+            )
+
+        with patch('mcp_colab_server.utils.asyncio.sleep', recording_sleep):
+            results = asyncio.run(run_both())
+
+        self.assertEqual(results, ["success", "success"])
+        self.assertEqual(call_counts, {"first": 3, "second": 3})
+
+        # Exponential schedule: each coroutine waits 0.1s then 0.2s
+        self.assertEqual([delay for _, delay in sleep_log], [0.1, 0.1, 0.2, 0.2])
+
+        # Both coroutines must enter their first backoff before either
+        # starts its second - the interleaving that collapses total wait
+        # time to max(delays) instead of their sum
+        tasks = [task for task, _ in sleep_log]
+        self.assertNotEqual(tasks[0], tasks[1])
+        self.assertEqual(tasks[0], tasks[2])
+        self.assertEqual(tasks[1], tasks[3])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file